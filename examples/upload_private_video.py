@@ -88,7 +88,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    from dotenv import load_dotenv
-    import os
+    from dotenv import load_dotenv  # optional helper, only needed when run directly
     load_dotenv()
     main()
@@ -4,6 +4,7 @@ import sys
 import os
 
 import pytest
+from cryptography.fernet import Fernet
 
 # Make the package importable when running from a source checkout.
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -35,7 +36,7 @@ def config(tmp_path):
         authorization_code_path=str(tmp_path / "code.txt"),
         hf_repo_id="user/tokens",
         hf_token="hf_test",
-        encryption_key=b"test-key",
+        encryption_key=Fernet.generate_key(),
     )
 
 
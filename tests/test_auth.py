@@ -1,10 +1,14 @@
 import builtins
 import json
+import os
 import sys
+import threading
+import time
 import types
 
 import pytest
 
+from youtube_auto_pub.auth import cli as cli_mod
 from youtube_auto_pub.auth import flow as flow_mod
 from youtube_auto_pub.auth import receivers
 from youtube_auto_pub.auth.instructions import build_reauth_instructions
@@ -25,6 +29,8 @@ def test_ntfy_reply_topic_derivation(monkeypatch):
 def test_check_local_file(tmp_path):
     path = tmp_path / "code.txt"
     assert receivers._check_local_file(str(path)) is None
+    path.write_text("")
+    assert receivers._check_local_file(str(path)) is None  # still being written
     path.write_text("  " + REDIRECT_URL + "\n")
     assert receivers._check_local_file(str(path)) == REDIRECT_URL
 
@@ -56,6 +62,19 @@ def test_check_ntfy_picks_latest_code_message(monkeypatch):
     assert captured["params"] == {"poll": "1", "since": "123"}
 
 
+def test_check_ntfy_uses_given_session(monkeypatch):
+    monkeypatch.setenv("NTFY_REPLY_TOPIC", "reply")
+    calls = []
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            calls.append(url)
+            return FakeNtfyResponse([{"event": "message", "message": REDIRECT_URL}])
+
+    assert receivers._check_ntfy(0, FakeSession()) == REDIRECT_URL
+    assert calls == ["https://ntfy.sh/reply/json"]
+
+
 def test_check_ntfy_ignores_chatter_and_errors(monkeypatch):
     monkeypatch.setenv("NTFY_REPLY_TOPIC", "reply")
     monkeypatch.setattr(receivers.requests, "get",
@@ -104,6 +123,44 @@ def test_wait_for_response_finds_local_file(config, monkeypatch):
     assert receivers.wait_for_response(config) == REDIRECT_URL
 
 
+def test_wait_for_response_wakes_early_for_local_file(config, monkeypatch):
+    monkeypatch.setenv("AUTH_CODE_WAIT_SECONDS", "60")
+    monkeypatch.setenv("AUTH_CODE_POLL_SECONDS", "30")
+    monkeypatch.setattr(receivers, "_check_hf", lambda c: None)
+
+    def write_response():
+        with open(config.authorization_code_path, "w") as f:
+            f.write(REDIRECT_URL)
+
+    timer = threading.Timer(0.2, write_response)
+    timer.start()
+    started = time.monotonic()
+    try:
+        assert receivers.wait_for_response(config) == REDIRECT_URL
+    finally:
+        timer.cancel()
+    assert time.monotonic() - started < 5  # not held until the next 30s poll
+
+
+def test_wait_for_response_wakes_for_file_written_during_remote_poll(config, monkeypatch):
+    monkeypatch.setenv("AUTH_CODE_WAIT_SECONDS", "60")
+    monkeypatch.setenv("AUTH_CODE_POLL_SECONDS", "8")
+    polls = []
+
+    def slow_hf(c):
+        polls.append(1)
+        if len(polls) == 1:  # the response lands while the HF check runs
+            with open(config.authorization_code_path, "w") as f:
+                f.write(REDIRECT_URL)
+        return None
+
+    monkeypatch.setattr(receivers, "_check_hf", slow_hf)
+    started = time.monotonic()
+
+    assert receivers.wait_for_response(config) == REDIRECT_URL
+    assert time.monotonic() - started < 5  # not held until the next 8s poll
+
+
 def test_wait_for_response_times_out(config, monkeypatch):
     monkeypatch.setenv("AUTH_CODE_WAIT_SECONDS", "0")
     assert receivers.wait_for_response(config) is None
@@ -143,7 +200,7 @@ def fake_flow(config, monkeypatch, tmp_path):
         json.dump({"installed": {"client_id": "id"}}, f)
 
     flow = FakeFlow()
-    monkeypatch.setattr(flow_mod.Flow, "from_client_secrets_file",
+    monkeypatch.setattr(flow_mod.Flow, "from_client_config",
                         classmethod(lambda cls, *a, **k: flow))
     return flow
 
@@ -157,6 +214,21 @@ def test_prompt_mode_reads_stdin_and_saves_token(config, fake_flow, monkeypatch)
     assert json.load(open(config.token_file_path)) == {"token": "new"}
 
 
+def test_relax_token_scope_set_only_by_a_running_flow(config, fake_flow, monkeypatch):
+    import subprocess
+    monkeypatch.delenv("OAUTHLIB_RELAX_TOKEN_SCOPE", raising=False)
+    imported = subprocess.run(
+        [sys.executable, "-c", "import os, youtube_auto_pub.uploader; "
+                               "print(os.environ.get('OAUTHLIB_RELAX_TOKEN_SCOPE'))"],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert imported.stdout.strip() == "None"  # no import-time side effect
+
+    monkeypatch.setattr(builtins, "input", lambda *a: REDIRECT_URL)
+    flow_mod.run_code_flow(config, prompt=True)
+    assert os.environ["OAUTHLIB_RELAX_TOKEN_SCOPE"] == "1"
+
+
 def test_unattended_mode_notifies_and_waits(config, fake_flow, notifier, monkeypatch):
     monkeypatch.setattr(flow_mod.receivers, "wait_for_response", lambda c: REDIRECT_URL)
 
@@ -183,8 +255,97 @@ def test_html_escaped_response_is_unescaped(config, fake_flow, monkeypatch):
     assert fake_flow.fetched["code"] == "4/0AeaTESTCODE"
 
 
+@pytest.mark.parametrize("url, code", [
+    (REDIRECT_URL, "4/0AeaTESTCODE"),
+    ("http://localhost/?code=4%2F0AeaTESTCODE&scope=youtube", "4/0AeaTESTCODE"),
+    ("http://localhost/?state=x&code=abc#fragment", "abc"),
+    ("http://localhost/?code=&state=x", None),
+    ("http://localhost/?state=x", None),
+])
+def test_extract_code(url, code):
+    assert flow_mod._extract_code(url) == code
+
+
 def test_garbage_response_raises(config, fake_flow, monkeypatch):
     monkeypatch.setattr(builtins, "input", lambda *a: "not a url at all")
 
     with pytest.raises(ValueError, match="Could not extract code"):
         flow_mod.run_code_flow(config, prompt=True)
+
+
+# ------------------------------------------------------------------- cli
+
+def write_token(config, scopes):
+    os.makedirs(config.encrypt_path, exist_ok=True)
+    with open(config.token_file_path, "w") as f:
+        json.dump({"client_id": "id", "scopes": scopes}, f)
+
+
+def test_cli_skips_flow_for_valid_token(config, monkeypatch):
+    valid = types.SimpleNamespace(valid=True, expired=False, refresh_token="r")
+    monkeypatch.setattr(cli_mod.credentials, "load", lambda path, scopes: valid)
+    assert cli_mod._stored_token_usable(config) is False  # no token file
+
+    write_token(config, config.scopes)
+    assert cli_mod._stored_token_usable(config) is True
+
+    monkeypatch.setattr(cli_mod.credentials, "load", lambda path, scopes: None)
+    assert cli_mod._stored_token_usable(config) is False
+
+
+def test_cli_requires_consent_for_new_scopes(config, monkeypatch):
+    valid = types.SimpleNamespace(valid=True, expired=False, refresh_token="r")
+    monkeypatch.setattr(cli_mod.credentials, "load", lambda path, scopes: valid)
+    write_token(config, config.scopes[:1])
+
+    assert cli_mod._stored_token_usable(config) is False
+
+
+def test_cli_refreshes_expired_token(config, monkeypatch):
+    write_token(config, config.scopes)
+    expired = types.SimpleNamespace(valid=False, expired=True, refresh_token="r")
+    refreshed = types.SimpleNamespace(valid=True)
+    monkeypatch.setattr(cli_mod.credentials, "load", lambda path, scopes: expired)
+    monkeypatch.setattr(cli_mod.credentials, "refresh", lambda creds, path, n: refreshed)
+    assert cli_mod._stored_token_usable(config) is True
+
+
+@pytest.fixture
+def cli_run(config, monkeypatch):
+    """Run main() against `config` (local only, no HF) with the given args."""
+    monkeypatch.chdir(os.path.dirname(config.encrypt_path))
+    monkeypatch.setattr(cli_mod, "YouTubeConfig", lambda **kw: config)
+    config.hf_repo_id = None  # authorize locally only
+    flows = []
+    monkeypatch.setattr(cli_mod, "run_code_flow",
+                        lambda config, prompt: flows.append(prompt))
+
+    def run(*args):
+        monkeypatch.setattr(sys, "argv", ["youtube-auth", *args])
+        cli_mod.main()
+        return flows
+
+    return run
+
+
+def test_cli_main_skips_or_forces_flow(config, cli_run, monkeypatch):
+    monkeypatch.setattr(cli_mod.credentials, "load", lambda path, scopes: types.SimpleNamespace(
+        valid=True, expired=False, refresh_token="r"))
+    write_token(config, config.scopes)
+
+    assert cli_run() == []  # valid token: no consent
+    assert cli_run("--force", "--prompt") == [True]
+
+
+def test_cli_main_exits_on_transient_refresh_failure(config, cli_run, monkeypatch):
+    write_token(config, config.scopes)
+    monkeypatch.setattr(cli_mod.credentials, "load", lambda path, scopes: types.SimpleNamespace(
+        valid=False, expired=True, refresh_token="r"))
+
+    def failing(creds, path, n):
+        raise RuntimeError("Token refresh failed after retries")
+    monkeypatch.setattr(cli_mod.credentials, "refresh", failing)
+
+    with pytest.raises(SystemExit, match="refresh token was kept"):
+        cli_run()
+    assert cli_run("--force") == [False]  # explicit override still works
@@ -40,6 +40,22 @@ def test_token_matches_client(tmp_path):
     assert credentials.token_matches_client(str(token), "abc") is False
 
 
+def test_json_parsed_once_per_file_version(tmp_path, monkeypatch):
+    path = tmp_path / "client.json"
+    write_client_secret(str(path), "id-a")
+    parses = []
+    real_load = json.load
+    monkeypatch.setattr(credentials.json, "load", lambda f: parses.append(1) or real_load(f))
+
+    assert credentials.extract_client_id(str(path)) == "id-a"
+    assert credentials.extract_client_id(str(path)) == "id-a"
+    assert len(parses) == 1  # second read served from the cache
+
+    write_client_secret(str(path), "id-bb")  # new size and mtime
+    assert credentials.extract_client_id(str(path)) == "id-bb"
+    assert len(parses) == 2
+
+
 # ------------------------------------------------- sync_local_client_secret
 
 def test_first_time_setup_adopts_cwd_secret(tmp_path, monkeypatch):
@@ -61,7 +77,8 @@ def test_client_rotation_replaces_secret_and_deletes_token(tmp_path, monkeypatch
         json.dump({"client_id": "old-id"}, f)
     write_client_secret("ytcredentials.json", "new-id")
 
-    credentials.sync_local_client_secret(config, config.client_id_path, config.token_file_path)
+    assert credentials.sync_local_client_secret(
+        config, config.client_id_path, config.token_file_path) is True
 
     assert credentials.extract_client_id(config.client_id_path) == "new-id"
     assert not os.path.exists(config.token_file_path)  # forced re-auth
@@ -75,7 +92,8 @@ def test_same_client_id_leaves_everything_alone(tmp_path, monkeypatch):
         json.dump({"client_id": "same-id"}, f)
     write_client_secret("ytcredentials.json", "same-id")
 
-    credentials.sync_local_client_secret(config, config.client_id_path, config.token_file_path)
+    assert credentials.sync_local_client_secret(
+        config, config.client_id_path, config.token_file_path) is False
 
     assert os.path.exists(config.token_file_path)
 
@@ -104,6 +122,28 @@ def test_explicit_local_client_secret_path(tmp_path, monkeypatch):
     assert credentials.extract_client_id(config.client_id_path) == "explicit-id"
 
 
+def test_same_size_in_place_copy_is_not_served_stale(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = YouTubeConfig(encrypt_path=str(tmp_path / "enc"))
+    stored = config.client_id_path
+    write_client_secret(stored, "id-aaa")
+    st = os.stat(stored)
+    write_client_secret("ytcredentials.json", "id-bbb")  # same size
+
+    credentials.sync_local_client_secret(config, stored, config.token_file_path)
+    os.utime(stored, ns=(st.st_atime_ns, st.st_mtime_ns))  # coarse-timestamp FS
+
+    assert os.stat(stored).st_ino == st.st_ino  # copied in place
+    assert credentials.extract_client_id(stored) == "id-bbb"
+
+
+def test_candidate_paths_are_deduplicated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = YouTubeConfig(local_client_secret_path=str(tmp_path / "ytcredentials.json"))
+
+    assert credentials._candidate_client_paths(config) == ["ytcredentials.json"]
+
+
 # ------------------------------------------------------------ load / refresh
 
 def test_load_missing_token_returns_none(tmp_path):
@@ -140,6 +180,28 @@ def test_refresh_success_saves_token(tmp_path, notifier):
     assert notifier.calls == []
 
 
+def test_save_is_atomic_and_private(tmp_path):
+    token_path = tmp_path / "nested" / "token.json"
+
+    credentials.save(FakeCreds(), str(token_path))
+
+    assert json.load(open(token_path)) == {"token": "refreshed"}
+    assert token_path.stat().st_mode & 0o777 == 0o600
+    assert os.listdir(token_path.parent) == ["token.json"]  # no temp file left
+
+
+def test_save_ignores_stale_world_readable_temp_file(tmp_path):
+    token_path = tmp_path / "token.json"
+    stale = tmp_path / "token.json.tmp"  # left behind by the old fixed-name scheme
+    stale.write_text("junk")
+    stale.chmod(0o644)
+
+    credentials.save(FakeCreds(), str(token_path))
+
+    assert token_path.stat().st_mode & 0o777 == 0o600
+    assert stale.read_text() == "junk"  # never reused as the temp file
+
+
 def test_refresh_invalid_grant_returns_none_and_notifies(tmp_path, notifier):
     creds = FakeCreds(error=RefreshError("invalid_grant: Token has been revoked"))
 
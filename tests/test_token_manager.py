@@ -32,6 +32,14 @@ def test_missing_settings_reported_together(tmp_path):
     assert "ENCRYPT_KEY" in message
 
 
+def test_invalid_key_rejected_at_init(tmp_path):
+    config = YouTubeConfig(encrypt_path=str(tmp_path / "enc"), hf_repo_id="user/tokens",
+                           hf_token="hf_test", encryption_key="not-a-fernet-key")
+
+    with pytest.raises(ValueError):
+        TokenManager(config)
+
+
 def test_init_empties_stale_encrypt_dir(config, tmp_path):
     os.makedirs(config.encrypt_path)
     stale = os.path.join(config.encrypt_path, "stale.json")
@@ -43,6 +51,19 @@ def test_init_empties_stale_encrypt_dir(config, tmp_path):
     assert not os.path.exists(stale)
 
 
+def test_init_removes_subdirs_and_symlinks_not_targets(config, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+    os.makedirs(os.path.join(config.encrypt_path, ".cache", "nested"))
+    os.symlink(outside, os.path.join(config.encrypt_path, "link"))
+
+    TokenManager(config)
+
+    assert os.listdir(config.encrypt_path) == []
+    assert (outside / "keep.txt").read_text() == "keep"  # symlink target untouched
+
+
 def test_encrypt_and_upload_roundtrip(config, tmp_path, monkeypatch):
     calls = {}
 
@@ -53,10 +74,8 @@ def test_encrypt_and_upload_roundtrip(config, tmp_path, monkeypatch):
         def create_repo(self, repo_id, repo_type, private, exist_ok):
             calls["create"] = {"repo_id": repo_id, "private": private, "exist_ok": exist_ok}
 
-        def upload_folder(self, folder_path, repo_id, repo_type, commit_message,
-                          ignore_patterns=None):
-            calls["upload"] = {"folder": folder_path, "repo_id": repo_id,
-                               "ignore": ignore_patterns}
+        def create_commit(self, repo_id, repo_type, operations, commit_message):
+            calls["commit"] = {"repo_id": repo_id, "operations": operations}
 
     monkeypatch.setattr(tm_mod, "HfApi", FakeApi)
 
@@ -66,30 +85,35 @@ def test_encrypt_and_upload_roundtrip(config, tmp_path, monkeypatch):
 
     manager.encrypt_and_upload([str(secret_file)])
 
-    # Repo auto-created private, cache junk excluded from the upload.
+    # Repo auto-created private; only the listed file is committed.
     assert calls["create"] == {"repo_id": "user/tokens", "private": True, "exist_ok": True}
-    assert calls["upload"]["repo_id"] == "user/tokens"
-    assert ".cache*" in calls["upload"]["ignore"]
+    assert calls["commit"]["repo_id"] == "user/tokens"
+    (operation,) = calls["commit"]["operations"]
+    assert operation.path_in_repo == "token.json"
 
-    # File on disk is really encrypted, and decrypts back to the original.
-    encrypted = open(os.path.join(config.encrypt_path, "token.json"), "rb").read()
+    # Uploaded bytes are really encrypted, and decrypt back to the original.
+    encrypted = operation.path_or_fileobj.getvalue()
     assert b"shh" not in encrypted
     assert Fernet(KEY).decrypt(encrypted) == b'{"refresh_token": "shh"}'
 
+    # Nothing staged on disk; the local file is untouched.
+    assert os.listdir(config.encrypt_path) == []
+    assert secret_file.read_text() == '{"refresh_token": "shh"}'
+
 
 def test_encrypt_and_upload_skips_missing_files(config, monkeypatch):
-    uploads = []
+    commits = []
 
     class FakeApi:
         def __init__(self, token): pass
         def create_repo(self, **kw): pass
-        def upload_folder(self, **kw): uploads.append(kw)
+        def create_commit(self, **kw): commits.append(kw)
 
     monkeypatch.setattr(tm_mod, "HfApi", FakeApi)
 
     TokenManager(config).encrypt_and_upload(["/nope/missing.json"])
 
-    assert len(uploads) == 1  # upload still runs, nothing crashes
+    assert commits == []  # nothing to commit, nothing crashes
     assert os.listdir(config.encrypt_path) == []
 
 
@@ -122,3 +146,12 @@ def test_download_missing_file_returns_expected_path(config, monkeypatch):
     # First-time setup: path is where the file will be created later.
     assert path == os.path.join(config.encrypt_path, "token.json")
     assert not os.path.exists(path)
+
+
+def test_download_and_decrypt_many_keeps_order(config, monkeypatch):
+    manager = TokenManager(config)
+    monkeypatch.setattr(manager, "download_and_decrypt", lambda name: f"/local/{name}")
+
+    paths = manager.download_and_decrypt_many(["a.json", "b.json"])
+
+    assert paths == ["/local/a.json", "/local/b.json"]
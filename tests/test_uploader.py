@@ -37,18 +37,75 @@ def test_get_service_with_valid_creds(uploader, config, monkeypatch):
 
     valid_creds = types.SimpleNamespace(valid=True, expired=False, refresh_token="r")
     monkeypatch.setattr(up_mod.credentials, "load", lambda path, scopes: valid_creds)
-    monkeypatch.setattr(up_mod, "build",
-                        lambda *a, **k: types.SimpleNamespace(
-                            channels=lambda: types.SimpleNamespace(
-                                list=lambda **kw: types.SimpleNamespace(execute=lambda: {}))))
+    builds = []
+
+    def fake_build(*args, **kwargs):
+        builds.append(kwargs)
+        return types.SimpleNamespace(
+            channels=lambda: types.SimpleNamespace(
+                list=lambda **kw: types.SimpleNamespace(execute=lambda: {})))
+
+    monkeypatch.setattr(up_mod, "build", fake_build)
 
     service = uploader.get_service(cache_key="main")
 
     assert service is not None
-    assert len(uploaded) == 2  # token + client secret re-uploaded
+    assert builds[0]["static_discovery"] is True  # no discovery fetch
+    assert uploaded == []  # nothing changed, Hub copy left alone
     assert uploader.get_service(cache_key="main") is service  # cached
 
 
+def test_get_service_reuses_valid_in_memory_creds(uploader, config, monkeypatch):
+    make_valid_token(config)
+    downloads = []
+    monkeypatch.setattr(uploader.token_manager, "download_and_decrypt",
+                        lambda name: downloads.append(name) or os.path.join(config.encrypt_path, name))
+    creds = types.SimpleNamespace(valid=True, expired=False, refresh_token="r")
+    monkeypatch.setattr(up_mod.credentials, "load", lambda path, scopes: creds)
+    built_with = []
+
+    def fake_build(*args, credentials=None, **kwargs):
+        built_with.append(credentials)
+        return types.SimpleNamespace(
+            channels=lambda: types.SimpleNamespace(
+                list=lambda **kw: types.SimpleNamespace(execute=lambda: {})))
+
+    monkeypatch.setattr(up_mod, "build", fake_build)
+
+    first = uploader.get_service()
+    a, b = uploader.get_service("a"), uploader.get_service("b")
+
+    assert first is not a and a is not b  # separate service per call / cache_key
+    assert uploader.get_service("a") is a  # cache_key still memoizes
+    assert len(downloads) == 2  # token + client secret, first call only
+    assert built_with == [creds, creds, creds]
+
+    creds.valid = False  # expired in memory -> back to the Hub
+    uploader.get_service(skip_auth_flow=True)
+    assert len(downloads) == 4
+
+
+def test_get_service_uploads_refreshed_token(uploader, config, monkeypatch):
+    make_valid_token(config)
+    monkeypatch.setattr(uploader.token_manager, "download_and_decrypt",
+                        lambda name: os.path.join(config.encrypt_path, name))
+    uploaded = []
+    monkeypatch.setattr(uploader.token_manager, "encrypt_and_upload",
+                        lambda paths: uploaded.extend(paths))
+
+    expired = types.SimpleNamespace(valid=False, expired=True, refresh_token="r")
+    refreshed = types.SimpleNamespace(valid=True, expired=False, refresh_token="r")
+    monkeypatch.setattr(up_mod.credentials, "load", lambda path, scopes: expired)
+    monkeypatch.setattr(up_mod.credentials, "refresh", lambda creds, path, n: refreshed)
+    monkeypatch.setattr(up_mod, "build", lambda *a, **k: types.SimpleNamespace(
+        channels=lambda: types.SimpleNamespace(
+            list=lambda **kw: types.SimpleNamespace(execute=lambda: {}))))
+
+    uploader.get_service()
+
+    assert uploaded == [config.token_file_path, config.client_id_path]
+
+
 def test_get_service_skip_auth_flow(uploader, config, monkeypatch):
     monkeypatch.setattr(uploader.token_manager, "download_and_decrypt",
                         lambda name: os.path.join(config.encrypt_path, name))
@@ -119,6 +176,18 @@ class FakeRequest:
         return None, {"id": "vid-123"}
 
 
+class FakeProgressRequest:
+    """Reports progress for each given fraction, then a response."""
+
+    def __init__(self, fractions):
+        self._statuses = [types.SimpleNamespace(progress=lambda f=f: f) for f in fractions]
+
+    def next_chunk(self):
+        if self._statuses:
+            return self._statuses.pop(0), None
+        return None, {"id": "vid-123"}
+
+
 class FakeService:
     def __init__(self, request):
         self._request = request
@@ -132,10 +201,23 @@ class FakeService:
         return self._request
 
 
+@pytest.fixture(autouse=True)
+def video_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "v.mp4").write_bytes(b"\0" * 1024)
+    return tmp_path / "v.mp4"
+
+
 @pytest.fixture(autouse=True)
 def fake_media(monkeypatch):
-    monkeypatch.setattr(up_mod, "MediaFileUpload",
-                        lambda path, chunksize=None, resumable=None: object())
+    created = []
+
+    def fake(path, chunksize=None, resumable=None):
+        created.append({"path": path, "chunksize": chunksize})
+        return object()
+
+    monkeypatch.setattr(up_mod, "MediaFileUpload", fake)
+    return created
 
 
 def test_upload_success_builds_correct_body(uploader):
@@ -151,6 +233,79 @@ def test_upload_success_builds_correct_body(uploader):
     assert service.body["status"]["publishAt"] == "2026-08-01T12:00:00Z"
 
 
+def test_upload_chunksize_from_config_or_override(uploader, config, fake_media):
+    uploader.upload_video(FakeService(FakeRequest()), "v.mp4", VideoMetadata(title="t"),
+                          chunksize=8 * 1024 * 1024)
+    config.upload_chunksize = 100 * 1024 * 1024
+    uploader.upload_video(FakeService(FakeRequest()), "v.mp4", VideoMetadata(title="t"))
+
+    assert [m["chunksize"] for m in fake_media] == [8 * 1024 * 1024, 100 * 1024 * 1024]
+
+
+@pytest.mark.parametrize("size, chunksize", [
+    (1024, -1),
+    (128 * 1024 * 1024 - 1, -1),
+    (128 * 1024 * 1024, 8 * 1024 * 1024),
+    (10 * 1024 ** 3, 8 * 1024 * 1024),
+])
+def test_chunksize_picked_from_file_size(size, chunksize):
+    assert YouTubeUploader._pick_chunksize(size) == chunksize
+
+
+def test_upload_rejects_missing_or_empty_video(uploader, notifier, video_file, fake_media):
+    service = FakeService(FakeRequest())
+    assert uploader.upload_video(service, "missing.mp4", VideoMetadata(title="t")) is None
+    video_file.write_bytes(b"")
+    assert uploader.upload_video(service, "v.mp4", VideoMetadata(title="t")) is None
+
+    assert fake_media == [] and service.body is None  # no upload session started
+    assert notifier.titles() == ["YouTube upload failed", "YouTube upload failed"]
+
+
+@pytest.mark.parametrize("chunksize", [0, 1000, 256 * 1024 + 1])
+def test_upload_rejects_misaligned_chunksize(uploader, chunksize):
+    with pytest.raises(ValueError, match="multiple of 262144"):
+        uploader.upload_video(FakeService(FakeRequest()), "v.mp4",
+                              VideoMetadata(title="t"), chunksize=chunksize)
+
+
+def test_upload_progress_is_throttled(uploader, monkeypatch, capsys):
+    monkeypatch.setattr(up_mod.time, "monotonic", lambda: 0.0)  # no time passes
+    service = FakeService(FakeProgressRequest([i / 100 for i in range(1, 101)]))
+
+    assert uploader.upload_video(service, "v.mp4", VideoMetadata(title="t")) == "vid-123"
+
+    reported = [line for line in capsys.readouterr().out.splitlines() if "% of the video" in line]
+    assert len(reported) == 20  # every 5%, not every chunk
+    assert reported[-1] == "[Uploader] Uploaded 100% of the video."
+
+
+def test_upload_videos_runs_jobs_concurrently_in_order(uploader, monkeypatch):
+    class TitleEchoService(FakeService):
+        """Returns the video title as its id; one instance per worker."""
+
+        def _insert(self, part, body, media_body):
+            return types.SimpleNamespace(next_chunk=lambda: (None, {"id": body["snippet"]["title"]}))
+
+    builds = []
+
+    def fake_build(*args, credentials=None, **kwargs):
+        builds.append(credentials)
+        return TitleEchoService(None)
+
+    monkeypatch.setattr(up_mod, "build", fake_build)
+    jobs = [("v.mp4", VideoMetadata(title=f"t{i}")) for i in range(4)]
+    jobs.append(("v.mp4", VideoMetadata(title="t4"), None))  # with thumbnail slot
+
+    with pytest.raises(ValueError, match="get_service"):
+        uploader.upload_videos(object(), jobs)  # no credentials known yet
+
+    uploader._creds = "creds"  # as resolved by get_service
+    assert uploader.upload_videos(object(), jobs, max_concurrency=3) == [f"t{i}" for i in range(5)]
+    assert uploader.upload_videos(object(), jobs[:2], creds="explicit") == ["t0", "t1"]
+    assert 2 <= len(builds) <= 5 and set(builds) == {"creds", "explicit"}  # one per worker
+
+
 def test_upload_retries_transient_5xx(uploader):
     service = FakeService(FakeRequest(errors=[http_error(503), http_error(500)]))
 
@@ -172,6 +327,50 @@ def test_upload_retry_budget_exhausted(uploader, notifier, monkeypatch):
     assert notifier.titles() == ["YouTube upload failed"]
 
 
+# ---------------------------------------------------------------- thumbnail
+
+def thumbnail_service(errors):
+    errors = list(errors)
+
+    def execute():
+        if errors:
+            raise errors.pop(0)
+        return {}
+
+    return types.SimpleNamespace(thumbnails=lambda: types.SimpleNamespace(
+        set=lambda **kw: types.SimpleNamespace(execute=execute)))
+
+
+def test_thumbnail_retries_transient_5xx_and_connection_errors(uploader):
+    errors = [http_error(503), ConnectionResetError("reset")]
+    assert uploader.set_thumbnail(thumbnail_service(errors), "vid", "t.jpg") is True
+
+
+def test_thumbnail_gives_up_on_4xx_and_exhausted_budget(uploader, monkeypatch):
+    assert uploader.set_thumbnail(thumbnail_service([http_error(400)]), "vid", "t.jpg") is False
+    monkeypatch.setenv("UPLOAD_MAX_RETRIES", "1")
+    assert uploader.set_thumbnail(thumbnail_service([http_error(503)] * 2), "vid", "t.jpg") is False
+    assert uploader.set_thumbnail(thumbnail_service([TimeoutError()] * 2), "vid", "t.jpg") is False
+
+
+def test_thumbnail_missing_file_fails_without_retrying(uploader, monkeypatch):
+    from googleapiclient.http import MediaFileUpload
+    monkeypatch.setattr(up_mod, "MediaFileUpload", MediaFileUpload)  # real file check
+    sleeps = []
+    monkeypatch.setattr(up_mod.time, "sleep", sleeps.append)
+
+    assert uploader.set_thumbnail(thumbnail_service([]), "vid", "missing.jpg") is False
+    assert sleeps == []
+
+
+def test_thumbnail_does_not_retry_programming_errors(uploader, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(up_mod.time, "sleep", sleeps.append)
+
+    assert uploader.set_thumbnail(thumbnail_service([KeyError("x")]), "vid", "t.jpg") is False
+    assert sleeps == []
+
+
 # --------------------------------------------------------------- end screen
 
 def test_end_screen_rejects_short_video(uploader):
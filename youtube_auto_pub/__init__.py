@@ -10,11 +10,20 @@ environment variables):
     uploader = YouTubeUploader(YouTubeConfig())
     service = uploader.get_service()
     uploader.upload_video(service, "video.mp4", VideoMetadata(title="Hi"))
+
+Only the config is imported eagerly; the other names load their module
+(and its Google / HuggingFace / cryptography dependencies) on first access.
 """
+import importlib
+
 from youtube_auto_pub.config import YouTubeConfig
-from youtube_auto_pub.notifier import Notifier
-from youtube_auto_pub.token_manager import TokenManager
-from youtube_auto_pub.uploader import YouTubeUploader, VideoMetadata
+
+_LAZY = {
+    "Notifier": "youtube_auto_pub.notifier",
+    "TokenManager": "youtube_auto_pub.token_manager",
+    "YouTubeUploader": "youtube_auto_pub.uploader",
+    "VideoMetadata": "youtube_auto_pub.uploader",
+}
 
 __version__ = "1.0.0"
 __all__ = [
@@ -24,3 +33,16 @@ __all__ = [
     "YouTubeUploader",
     "VideoMetadata",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,10 @@ encrypted credentials on HuggingFace in one go:
 
     python -m youtube_auto_pub.auth --prompt   # paste redirect URL in terminal
     python -m youtube_auto_pub.auth            # respond via ntfy / HF / file
+
+A stored token that is still valid (or refreshes cleanly) and already
+grants the requested scopes is kept as is; pass --force to run the consent
+flow anyway.
 """
 
 import argparse
@@ -16,9 +20,38 @@ from youtube_auto_pub.config import YouTubeConfig
 from youtube_auto_pub.token_manager import TokenManager
 
 
+class _ConsoleNotifier:
+    """Interactive command: alerts go to the terminal, not to push channels."""
+
+    def notify(self, title: str, message: str, **kwargs) -> bool:
+        print(f"[Auth] {title}\n{message}")
+        return False
+
+
+def _stored_token_usable(config: YouTubeConfig) -> bool:
+    """Whether the stored token grants config.scopes and works without a new
+    consent (refreshing it if needed).
+
+    Raises:
+        RuntimeError: if the refresh keeps failing for transient reasons; the
+            refresh token may still be good, so it must not be replaced.
+    """
+    try:
+        stored = credentials.load_json(config.token_file_path)
+    except (OSError, ValueError):
+        return False  # unreadable token: re-authorize
+    if not stored or not set(config.scopes) <= set(stored.get('scopes') or ()):
+        return False  # no token, or new scopes need a fresh consent
+    creds = credentials.load(config.token_file_path, config.scopes)
+    if creds and creds.expired and creds.refresh_token:
+        creds = credentials.refresh(creds, config.token_file_path, _ConsoleNotifier())
+    return bool(creds and creds.valid)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="Authorize YouTube access (one-time setup or manual re-auth).")
+        description="Authorize YouTube access (one-time setup, or re-auth with --force "
+                    "or new --scopes).")
     parser.add_argument("--client", "-c", default="ytcredentials.json",
                         help="Client secret filename (default: ytcredentials.json)")
     parser.add_argument("--token", "-t", default="yttoken.json",
@@ -27,6 +60,8 @@ def main() -> None:
                         help="Comma-separated OAuth scopes (default: YouTube upload/manage)")
     parser.add_argument("--prompt", "-p", action="store_true",
                         help="Paste the redirect URL on stdin instead of waiting for ntfy/HF/file")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Re-authorize even if the stored token is still valid")
     args = parser.parse_args()
 
     config = YouTubeConfig(client_secret_filename=args.client, token_filename=args.token)
@@ -38,13 +73,22 @@ def main() -> None:
     token_manager = None
     if config.hf_repo_id and config.hf_token and config.encryption_key:
         token_manager = TokenManager(config)
-        token_manager.download_and_decrypt(config.token_filename)
-        token_manager.download_and_decrypt(config.client_secret_filename)
+        token_manager.download_and_decrypt_many(
+            [config.token_filename, config.client_secret_filename])
 
     # Adopt a client secret sitting in the working directory (first-time setup).
     credentials.sync_local_client_secret(config, config.client_id_path, config.token_file_path)
 
-    run_code_flow(config, prompt=args.prompt)
+    try:
+        usable = not args.force and _stored_token_usable(config)
+    except RuntimeError as e:
+        raise SystemExit(f"[Auth] {e}\nThe stored refresh token was kept. Check the "
+                         "network and retry, or pass --force to re-authorize anyway.")
+    if usable:
+        print("[Auth] Stored credentials are valid; skipping authorization "
+              "(use --force to re-authorize).")
+    else:
+        run_code_flow(config, prompt=args.prompt)
 
     if token_manager:
         token_manager.encrypt_and_upload([config.token_file_path, config.client_id_path])
@@ -6,10 +6,11 @@ exchange the code for a token, and persist it.
 import html
 import os
 from typing import Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote_plus
 
 from google_auth_oauthlib.flow import Flow
 
+from youtube_auto_pub import credentials
 from youtube_auto_pub.config import YouTubeConfig
 from youtube_auto_pub.auth import receivers
 from youtube_auto_pub.auth.instructions import build_reauth_instructions
@@ -28,8 +29,11 @@ def run_code_flow(config: YouTubeConfig, prompt: bool = False, notifier=None) ->
     """
     receivers.clear_local_file(config.authorization_code_path)
 
-    flow = Flow.from_client_secrets_file(
-        config.client_id_path,
+    client_config = credentials.load_json(config.client_id_path)
+    if client_config is None:
+        raise FileNotFoundError(f"Client secret not found: {config.client_id_path}")
+    flow = Flow.from_client_config(
+        client_config,
         scopes=config.scopes,
         redirect_uri='http://localhost/'
     )
@@ -60,7 +64,8 @@ def run_code_flow(config: YouTubeConfig, prompt: bool = False, notifier=None) ->
         raise ValueError("Could not extract code from URL")
 
     # Google may return extra scopes (like 'openid'); don't treat as an error.
-    os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = '1'
+    # An explicit value from the environment is respected.
+    os.environ.setdefault('OAUTHLIB_RELAX_TOKEN_SCOPE', '1')
     flow.fetch_token(code=code)
     _save_token(config, flow.credentials)
 
@@ -77,15 +82,17 @@ def run_code_flow(config: YouTubeConfig, prompt: bool = False, notifier=None) ->
 
 def _extract_code(response_url: str) -> Optional[str]:
     """Pull the OAuth code out of a pasted redirect URL."""
-    response_url = html.unescape(response_url)
-    query = parse_qs(urlparse(response_url).query)
-    return query.get('code', [None])[0]
+    # A pasted URL is sometimes HTML-escaped (&amp;); every entity needs both
+    # characters, so clean URLs skip the unescape scan entirely.
+    if '&' in response_url and ';' in response_url:
+        response_url = html.unescape(response_url)
+    query = response_url.partition('?')[2].partition('#')[0]
+    for param in query.split('&'):
+        if param.startswith('code='):
+            return unquote_plus(param[5:]) or None
+    return None
 
 
 def _save_token(config: YouTubeConfig, creds) -> None:
-    token_dir = os.path.dirname(config.token_file_path)
-    if token_dir:
-        os.makedirs(token_dir, exist_ok=True)
-    with open(config.token_file_path, 'w') as f:
-        f.write(creds.to_json())
+    credentials.save(creds, config.token_file_path)
     print(f"[Auth] Credentials saved to '{config.token_file_path}'.")
@@ -17,6 +17,10 @@ import requests
 
 from youtube_auto_pub.config import YouTubeConfig
 
+# Backoff for stat'ing the local response file between remote polls.
+_LOCAL_FILE_CHECK_MIN_SECONDS = 0.1
+_LOCAL_FILE_CHECK_MAX_SECONDS = 2.0
+
 
 def auth_response_filename() -> str:
     return os.getenv("AUTH_RESPONSE_FILENAME", "auth_response.txt")
@@ -34,30 +38,40 @@ def ntfy_reply_topic() -> Optional[str]:
 def clear_local_file(path: str) -> None:
     """Remove a (possibly stale) local auth-response file."""
     try:
-        if os.path.exists(path):
-            os.remove(path)
-    except Exception:
-        pass
+        os.unlink(path)
+    except OSError:
+        pass  # already gone (FileNotFoundError) or not removable
+
+
+def _local_file_state(path: str) -> Optional[tuple]:
+    """(size, mtime) of the local response file if it has content (one stat)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns) if st.st_size > 0 else None
 
 
 def _check_local_file(path: str) -> Optional[str]:
+    if _local_file_state(path) is None:
+        return None
     try:
-        if os.path.exists(path):
-            with open(path, 'r') as f:
-                content = f.read().strip()
-            if content:
-                print("[Auth] Received authorization response via local file.")
-                return content
+        with open(path, 'r') as f:
+            content = f.read().strip()
+        if content:
+            print("[Auth] Received authorization response via local file.")
+            return content
     except Exception as e:
         print(f"[Auth] Error reading code file: {e}")
     return None
 
 
-def _check_ntfy(since_ts: int) -> Optional[str]:
+def _check_ntfy(since_ts: int, session: Optional[requests.Session] = None) -> Optional[str]:
     """Newest OAuth-looking message on the reply topic, newer than since_ts.
 
     The since filter guarantees a response from a previous flow is never
     replayed; requiring a code= parameter ignores unrelated chatter.
+    Pass a `session` to reuse its keep-alive connection across polls.
     """
     topic = ntfy_reply_topic()
     if not topic:
@@ -70,7 +84,7 @@ def _check_ntfy(since_ts: int) -> Optional[str]:
         headers["Authorization"] = f"Bearer {token}"
 
     try:
-        resp = requests.get(
+        resp = (session or requests).get(
             f"{server}/{topic}/json",
             params={"poll": "1", "since": str(since_ts)},
             headers=headers,
@@ -135,12 +149,37 @@ def _check_hf(config: YouTubeConfig) -> Optional[str]:
         return None
 
 
+def _wait_for_local_file(path: str, timeout: float, seen: Optional[tuple]) -> None:
+    """Sleep up to `timeout` seconds, waking early once `path` gets new content.
+
+    `seen` is the file state from before this round's checks, so a response
+    written while the remote sources were being polled still wakes the wait.
+
+    The remote sources cost a network round-trip and are polled every
+    AUTH_CODE_POLL_SECONDS; the local file is a cheap stat, so it is
+    watched in between (backing off from 0.1s to 2s) and a response
+    written on the server is picked up almost immediately instead of at
+    the next poll boundary.
+    """
+    deadline = time.monotonic() + timeout
+    delay = _LOCAL_FILE_CHECK_MIN_SECONDS
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        state = _local_file_state(path)
+        if state is not None and state != seen:
+            return
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, _LOCAL_FILE_CHECK_MAX_SECONDS)
+
+
 def wait_for_response(config: YouTubeConfig) -> Optional[str]:
     """Poll all sources until an auth response arrives or the window closes."""
     wait_seconds = int(os.getenv("AUTH_CODE_WAIT_SECONDS", "1800"))
     poll_interval = int(os.getenv("AUTH_CODE_POLL_SECONDS", "15"))
-    started_at = int(time.time())
-    deadline = started_at + wait_seconds
+    started_at = int(time.time())  # ntfy `since` is wall-clock
+    deadline = time.monotonic() + wait_seconds
 
     sources = [f"local file: {config.authorization_code_path}"]
     if ntfy_reply_topic():
@@ -150,15 +189,21 @@ def wait_for_response(config: YouTubeConfig) -> Optional[str]:
     print(f"[Auth] Waiting up to {wait_seconds}s for authorization response "
           f"({'; '.join(sources)})")
 
-    while time.time() < deadline:
-        response = (
-            _check_local_file(config.authorization_code_path)
-            or _check_ntfy(started_at)
-            or _check_hf(config)
-        )
-        if response:
-            return response
-        time.sleep(poll_interval)
+    # One session for the whole window: the ntfy polls reuse a single
+    # TLS connection instead of a fresh handshake every AUTH_CODE_POLL_SECONDS.
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            local_state = _local_file_state(config.authorization_code_path)
+            response = (
+                _check_local_file(config.authorization_code_path)
+                or _check_ntfy(started_at, session)
+                or _check_hf(config)
+            )
+            if response:
+                return response
+            _wait_for_local_file(config.authorization_code_path,
+                                 min(poll_interval, max(deadline - time.monotonic(), 0)),
+                                 local_state)
 
     print("[Auth] Timed out waiting for authorization response.")
     return None
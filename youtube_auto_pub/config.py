@@ -36,6 +36,9 @@ class YouTubeConfig:
         encryption_key: Fernet key, str or bytes (env fallback)
         local_client_secret_path: Explicit path to a local client secret
         scopes: OAuth scopes to request
+        upload_chunksize: Bytes per resumable upload request; a multiple of
+            256 KiB, -1 to send the whole file in one request, or None to
+            pick one from the video size
     """
     client_secret_filename: str = "ytcredentials.json"
     token_filename: str = "yttoken.json"
@@ -47,6 +50,7 @@ class YouTubeConfig:
     encryption_key: Union[str, bytes, None] = None
     local_client_secret_path: Optional[str] = None
     scopes: List[str] = field(default_factory=lambda: list(DEFAULT_SCOPES))
+    upload_chunksize: Optional[int] = None
 
     def __post_init__(self):
         self.hf_repo_id = self.hf_repo_id or os.getenv("HF_YT_CRED_REPO_ID") or os.getenv("HF_REPO_ID")
@@ -4,10 +4,13 @@ validation and refresh. Knows nothing about YouTube or notifications
 beyond alerting through a provided notifier.
 """
 
+import functools
 import json
 import os
 import shutil
+import tempfile
 import time
+from pathlib import Path
 from typing import Optional
 
 from google.auth.exceptions import RefreshError
@@ -17,13 +20,39 @@ from google.oauth2.credentials import Credentials
 from youtube_auto_pub.config import YouTubeConfig
 
 
+@functools.lru_cache(maxsize=16)
+def _load_json_cached(path: str, st_ino: int, st_size: int, st_mtime_ns: int) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_json(path: str) -> Optional[dict]:
+    """Parse a small JSON file, or None if absent.
+
+    Parsed once per file version: the cache is keyed by the file's inode,
+    size and mtime. An in-place rewrite of the same size can keep all three
+    on filesystems with coarse timestamps, so every place this package
+    writes a credentials file calls clear_json_cache(). The returned dict
+    is shared - do not mutate it.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _load_json_cached(path, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def clear_json_cache() -> None:
+    """Forget parsed credential files; call after writing one."""
+    _load_json_cached.cache_clear()
+
+
 def extract_client_id(client_path: str) -> Optional[str]:
     """Read the client_id from a client_secrets.json file, if present."""
     try:
-        if not os.path.exists(client_path):
+        data = load_json(client_path)
+        if data is None:
             return None
-        with open(client_path, 'r') as f:
-            data = json.load(f)
         for key in ('installed', 'web'):
             if key in data and 'client_id' in data[key]:
                 return data[key]['client_id']
@@ -36,10 +65,9 @@ def extract_client_id(client_path: str) -> Optional[str]:
 def token_matches_client(token_path: str, client_id: str) -> bool:
     """Whether the stored token was issued for the given client_id."""
     try:
-        if not os.path.exists(token_path):
+        data = load_json(token_path)
+        if data is None:
             return True  # no token yet, nothing to mismatch
-        with open(token_path, 'r') as f:
-            data = json.load(f)
         token_client_id = data.get('client_id')
         if token_client_id is None:
             print("[Credentials] Token missing client_id field, will re-authenticate.")
@@ -50,28 +78,48 @@ def token_matches_client(token_path: str, client_id: str) -> bool:
         return False
 
 
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 def _candidate_client_paths(config: YouTubeConfig) -> list:
     """Places a local (possibly newer) client secret may live."""
     paths = [config.client_secret_filename]  # current working directory
     if config.local_client_secret_path:
         paths.append(config.local_client_secret_path)
-    return paths
+    # Drop aliases (e.g. local_client_secret_path pointing at the cwd file).
+    unique, seen = [], set()
+    for path in paths:
+        real = os.path.realpath(path)
+        if real not in seen:
+            seen.add(real)
+            unique.append(path)
+    return unique
 
 
-def sync_local_client_secret(config: YouTubeConfig, stored_client_path: str, token_path: str) -> None:
+def sync_local_client_secret(config: YouTubeConfig, stored_client_path: str, token_path: str) -> bool:
     """Adopt a local client secret when none is stored or the client changed.
 
     Covers first-time setup (nothing on HuggingFace yet: the user drops the
     downloaded OAuth client JSON next to the app) and client rotation. When
     the client_id changes, the stale token is deleted to force re-auth.
+
+    Returns:
+        True if the stored client secret or token was changed.
     """
+    changed = False
     stored_id = extract_client_id(stored_client_path)
+    stored_stat = _stat_or_none(stored_client_path)
 
     for candidate in _candidate_client_paths(config):
-        if not os.path.exists(candidate):
-            continue
-        if os.path.abspath(candidate) == os.path.abspath(stored_client_path):
+        candidate_stat = _stat_or_none(candidate)
+        if candidate_stat is None:
             continue
+        if stored_stat is not None and os.path.samestat(candidate_stat, stored_stat):
+            continue  # the stored file itself (same path, or a link to it)
         local_id = extract_client_id(candidate)
         if not local_id or local_id == stored_id:
             continue
@@ -82,23 +130,26 @@ def sync_local_client_secret(config: YouTubeConfig, stored_client_path: str, tok
             print(f"[Credentials] Client secret changed ('{candidate}'). Forcing re-authentication.")
         try:
             os.makedirs(os.path.dirname(stored_client_path) or '.', exist_ok=True)
-            shutil.copy(candidate, stored_client_path)
-            if stored_id is not None and os.path.exists(token_path):
-                os.remove(token_path)
+            shutil.copyfile(candidate, stored_client_path)
+            clear_json_cache()
+            changed = True
+            if stored_id is not None:
+                Path(token_path).unlink(missing_ok=True)
             stored_id = local_id
         except Exception as e:
             print(f"[Credentials] Error adopting local client secret: {e}")
         break
 
-    # Drop a token that was issued for a different client.
-    current_id = extract_client_id(stored_client_path)
-    if current_id and not token_matches_client(token_path, current_id):
+    # Drop a token that was issued for a different client. stored_id is
+    # the stored file's client_id (updated above after a successful copy).
+    if stored_id and not token_matches_client(token_path, stored_id):
         print("[Credentials] Token does not match the client secret. Deleting it to force re-auth.")
         try:
-            if os.path.exists(token_path):
-                os.remove(token_path)
+            Path(token_path).unlink(missing_ok=True)
+            changed = True
         except Exception as e:
             print(f"[Credentials] Error deleting stale token: {e}")
+    return changed
 
 
 def load(token_path: str, scopes: list) -> Optional[Credentials]:
@@ -114,6 +165,35 @@ def load(token_path: str, scopes: list) -> Optional[Credentials]:
         return None
 
 
+def save(creds: Credentials, token_path: str) -> None:
+    """Write credentials atomically, readable by the owner only.
+
+    The token goes to a uniquely named temp file (mode 0600) in the same
+    directory that replaces the old one in a single rename, so a crash
+    mid-write never leaves a truncated token behind and concurrent writers
+    never publish each other's half-written file.
+    """
+    token_dir = os.path.dirname(token_path)
+    if token_dir:
+        os.makedirs(token_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=token_dir or '.',
+                                    prefix=f".{os.path.basename(token_path)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(creds.to_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, token_path)
+        clear_json_cache()
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def refresh(creds: Credentials, token_path: str, notifier) -> Optional[Credentials]:
     """Refresh expired credentials, retrying transient errors with backoff.
 
@@ -134,8 +214,7 @@ def refresh(creds: Credentials, token_path: str, notifier) -> Optional[Credentia
             time.sleep(delay)
         try:
             creds.refresh(Request())
-            with open(token_path, 'w') as f:
-                f.write(creds.to_json())
+            save(creds, token_path)
             print("[Credentials] Credentials refreshed and saved.")
             return creds
         except RefreshError as e:
@@ -5,14 +5,17 @@ Files are Fernet-encrypted before upload and decrypted after download.
 The (private) repository is created automatically on first upload.
 """
 
+import io
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
-from huggingface_hub import hf_hub_download, HfApi
+from huggingface_hub import CommitOperationAdd, hf_hub_download, HfApi
 from cryptography.fernet import Fernet
 
+from youtube_auto_pub import credentials
 from youtube_auto_pub.config import YouTubeConfig
 
 
@@ -42,36 +45,44 @@ class TokenManager:
             if isinstance(self.config.encryption_key, str)
             else self.config.encryption_key
         )
+        self._fernet = Fernet(self._encryption_key)
+        self._hf_api = HfApi(token=self.config.hf_token)
 
     def encrypt_and_upload(self, local_file_paths: List[str]) -> None:
-        """Encrypt local files and upload them to HuggingFace Hub."""
-        fernet = Fernet(self._encryption_key)
+        """Encrypt local files and commit them to HuggingFace Hub.
 
+        The ciphertext is uploaded straight from memory; nothing is staged
+        on disk and the local files are left as they are.
+        """
+        operations = []
         for path in local_file_paths:
             if not os.path.exists(path):
                 print(f"[TokenManager] Skipping missing file: {path}")
                 continue
-            with open(path, 'r') as f:
-                data = fernet.encrypt(f.read().encode())
-            with open(f'{self.config.encrypt_path}/{Path(path).name}', "wb") as f:
-                f.write(data)
+            with open(path, 'rb') as f:
+                data = self._fernet.encrypt(f.read())
+            operations.append(CommitOperationAdd(
+                path_in_repo=Path(path).name,
+                path_or_fileobj=io.BytesIO(data),
+            ))
+        if not operations:
+            print("[TokenManager] No files to upload.")
+            return
 
-        api = HfApi(token=self.config.hf_token)
         # First-time setup: create the (private) repo if it does not exist yet.
-        api.create_repo(
+        self._hf_api.create_repo(
             repo_id=self.config.hf_repo_id,
             repo_type=self.config.hf_repo_type,
             private=True,
             exist_ok=True,
         )
-        api.upload_folder(
-            folder_path=self.config.encrypt_path,
+        self._hf_api.create_commit(
             repo_id=self.config.hf_repo_id,
             repo_type=self.config.hf_repo_type,
+            operations=operations,
             commit_message="Upload encrypted credentials",
-            ignore_patterns=[".cache*", "*.lock"],
         )
-        print(f"[TokenManager] Encrypted and uploaded {len(local_file_paths)} files successfully.")
+        print(f"[TokenManager] Encrypted and uploaded {len(operations)} files successfully.")
 
     def download_and_decrypt(self, file_name: str) -> str:
         """Download an encrypted file from HuggingFace Hub and decrypt it.
@@ -92,11 +103,9 @@ class TokenManager:
                 local_dir=self.config.encrypt_path
             )
 
-            fernet = Fernet(self._encryption_key)
-            with open(downloaded_path, "rb") as f:
-                data = fernet.decrypt(f.read()).decode("utf-8")
-            with open(downloaded_path, "w") as f:
-                f.write(data)
+            encrypted = Path(downloaded_path).read_bytes()
+            Path(downloaded_path).write_bytes(self._fernet.decrypt(encrypted))
+            credentials.clear_json_cache()  # rewritten in place
 
             print(f"[TokenManager] Downloaded and decrypted: {file_name}")
             return downloaded_path
@@ -105,6 +114,16 @@ class TokenManager:
             print(f"[TokenManager] This is expected for first-time setup. Returning local path: {local_file_path}")
             return local_file_path
 
+    def download_and_decrypt_many(self, file_names: List[str]) -> List[str]:
+        """download_and_decrypt for several files, fetched concurrently.
+
+        Returns the local paths in the order of `file_names`.
+        """
+        if len(file_names) <= 1:
+            return [self.download_and_decrypt(name) for name in file_names]
+        with ThreadPoolExecutor(max_workers=len(file_names)) as pool:
+            return list(pool.map(self.download_and_decrypt, file_names))
+
     @staticmethod
     def _create_directory(path: str) -> None:
         try:
@@ -116,16 +135,18 @@ class TokenManager:
     def _empty_directory(path: str) -> None:
         """Empty a directory without removing the directory itself."""
         try:
-            if not os.path.isdir(path):
-                return
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                try:
-                    if os.path.isdir(item_path) and not os.path.islink(item_path):
-                        shutil.rmtree(item_path)
-                    else:
-                        os.remove(item_path)
-                except Exception as e:
-                    print(f"[TokenManager] Warning: Failed to delete item {item_path}: {e}")
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        # DirEntry type comes from the directory listing: no
+                        # extra stat per item.
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.remove(entry.path)
+                    except Exception as e:
+                        print(f"[TokenManager] Warning: Failed to delete item {entry.path}: {e}")
+        except FileNotFoundError:
+            return  # nothing to empty
         except Exception as e:
             print(f"[TokenManager] Warning: Failed to empty directory {path}: {e}")
@@ -8,12 +8,18 @@ orchestrates them and talks to the YouTube API.
 """
 
 import os
+import random
 import re
+import socket
+import ssl
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
+import httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -25,6 +31,22 @@ from youtube_auto_pub.config import YouTubeConfig
 from youtube_auto_pub.notifier import Notifier
 from youtube_auto_pub.token_manager import TokenManager
 
+# The resumable upload protocol requires every chunk but the last to be a
+# multiple of 256 KiB.
+_CHUNK_ALIGNMENT = 256 * 1024
+
+_RETRIABLE_STATUS_CODES = (500, 502, 503, 504)
+
+# Network failures worth retrying; local errors (missing file, bad input)
+# are not in here and fail at once.
+_TRANSIENT_NETWORK_ERRORS = (
+    ConnectionError, TimeoutError, socket.timeout, ssl.SSLError, httplib2.HttpLib2Error,
+)
+
+# Upload progress is printed at most every 5% or every 2 seconds.
+_PROGRESS_STEP_PERCENT = 5
+_PROGRESS_MIN_SECONDS = 2.0
+
 
 @dataclass
 class VideoMetadata:
@@ -48,6 +70,12 @@ class VideoMetadata:
     publish_at: Optional[str] = None
 
 
+def _backoff_seconds(retry: int) -> float:
+    """Exponential backoff with jitter (so parallel uploads do not retry in
+    lockstep), capped at 64s."""
+    return min(2 ** retry + random.random(), 64)
+
+
 class YouTubeUploader:
     """Upload videos to YouTube with automatic credential management."""
 
@@ -56,6 +84,7 @@ class YouTubeUploader:
         self.token_manager = TokenManager(config)
         self.notifier = Notifier()
         self._services: dict = {}
+        self._creds: Optional[Credentials] = None  # last credentials in use
 
     # ------------------------------------------------------------------ #
     # authentication
@@ -69,8 +98,10 @@ class YouTubeUploader:
         """Get an authenticated YouTube API service.
 
         Downloads encrypted credentials from HuggingFace Hub, refreshes or
-        (re)authorizes as needed, re-uploads the updated credentials, and
-        returns a ready service object.
+        (re)authorizes as needed, re-uploads the credentials if anything
+        changed, and returns a ready service object. Later calls reuse the
+        in-memory credentials while they are valid; pass cache_key to reuse
+        the service object itself.
 
         Args:
             cache_key: Optional key to cache the service for reuse.
@@ -81,16 +112,26 @@ class YouTubeUploader:
             print(f"[Uploader] Using cached service for: {cache_key}")
             return self._services[cache_key]
 
+        if self._creds is not None and self._creds.valid:
+            # Same process, token not (nearly) expired: the Hub copy cannot
+            # be newer than what is in memory, so skip the download.
+            print("[Uploader] Reusing in-memory credentials.")
+            service = self._build_service(self._creds)  # cheap: static discovery
+            if cache_key:
+                self._services[cache_key] = service
+            return service
+
         print("[Uploader] Checking for stored credentials...")
-        token_path = self.token_manager.download_and_decrypt(self.config.token_filename)
-        client_path = self.token_manager.download_and_decrypt(self.config.client_secret_filename)
-        credentials.sync_local_client_secret(self.config, client_path, token_path)
+        token_path, client_path = self.token_manager.download_and_decrypt_many(
+            [self.config.token_filename, self.config.client_secret_filename])
+        changed = credentials.sync_local_client_secret(self.config, client_path, token_path)
 
         creds = credentials.load(token_path, self.config.scopes)
         if creds and creds.expired and creds.refresh_token:
             # Transient refresh failures raise (retry next cycle); only a
             # permanently dead grant returns None and falls through to re-auth.
             creds = credentials.refresh(creds, token_path, self.notifier)
+            changed = True
 
         if not creds or not creds.valid:
             if skip_auth_flow:
@@ -98,16 +139,27 @@ class YouTubeUploader:
                 return None
             print("[Uploader] No valid credentials. Starting authorization flow.")
             creds = self._run_auth_flow()
+            changed = True
 
-        self.token_manager.encrypt_and_upload([token_path, client_path])
+        # Steady state (valid token, same client): the Hub copy is current.
+        if changed:
+            self.token_manager.encrypt_and_upload([token_path, client_path])
 
-        service = build('youtube', 'v3', credentials=creds)
+        service = self._build_service(creds)
+        self._creds = creds
         self._print_channel_info(service)
 
         if cache_key:
             self._services[cache_key] = service
         return service
 
+    @staticmethod
+    def _build_service(creds: Credentials) -> Any:
+        # Use the discovery document bundled with googleapiclient: no
+        # network fetch and no on-disk discovery cache.
+        return build('youtube', 'v3', credentials=creds,
+                     static_discovery=True, cache_discovery=False)
+
     @staticmethod
     def _use_stdin_prompt() -> bool:
         """Decide how the auth response is collected, via AUTH_MODE:
@@ -172,13 +224,47 @@ class YouTubeUploader:
         service: Any,
         video_path: str,
         metadata: VideoMetadata,
-        thumbnail_path: Optional[str] = None
+        thumbnail_path: Optional[str] = None,
+        chunksize: Optional[int] = None
     ) -> Optional[str]:
         """Upload a video (resumable, retrying transient errors).
 
+        Args:
+            chunksize: Bytes per upload request, overriding
+                config.upload_chunksize. Bigger chunks mean fewer round-trips
+                and better throughput on fast links but hold more of the file
+                in memory; -1 sends the whole file in one request (no
+                progress reports, RAM use grows with the file). None on both
+                picks a size from the file size.
+
         Returns:
-            Video ID if successful, None otherwise.
+            Video ID if successful, None otherwise (including a missing or
+            empty video file, which is reported before any API call).
+
+        Raises:
+            ValueError: if chunksize is neither -1 nor a positive multiple
+                of 256 KiB.
         """
+        if chunksize is None:
+            chunksize = self.config.upload_chunksize
+        if chunksize is not None and chunksize != -1 and (
+                chunksize <= 0 or chunksize % _CHUNK_ALIGNMENT):
+            raise ValueError(
+                f"upload chunksize must be -1 or a positive multiple of "
+                f"{_CHUNK_ALIGNMENT} bytes, got {chunksize}"
+            )
+
+        try:
+            size = os.stat(video_path).st_size
+            if size == 0:
+                raise ValueError("video file is empty")
+        except (OSError, ValueError) as e:
+            print(f"[Uploader] Cannot upload {video_path}: {e}")
+            self._notify_upload_failure(video_path, metadata.title, e)
+            return None
+        if chunksize is None:
+            chunksize = self._pick_chunksize(size)
+
         request_body = {
             'snippet': {
                 'categoryId': metadata.category_id,
@@ -195,7 +281,7 @@ class YouTubeUploader:
         if metadata.publish_at:
             request_body['status']['publishAt'] = metadata.publish_at
 
-        media_file = MediaFileUpload(video_path, chunksize=-1, resumable=True)
+        media_file = MediaFileUpload(video_path, chunksize=chunksize, resumable=True)
         request = service.videos().insert(
             part='snippet,status',
             body=request_body,
@@ -204,22 +290,28 @@ class YouTubeUploader:
 
         print(f"[Uploader] Uploading video: {video_path}")
         response = None
-        retriable_status_codes = (500, 502, 503, 504)
         max_retries = int(os.getenv("UPLOAD_MAX_RETRIES", "5"))
         retry = 0
+        last_percent, last_report = 0, time.monotonic()
 
         while response is None:
             try:
                 status, response = request.next_chunk()
                 if status:
-                    print(f'[Uploader] Uploaded {int(status.progress() * 100)}% of the video.')
+                    percent = int(status.progress() * 100)
+                    now = time.monotonic()
+                    if (percent - last_percent >= _PROGRESS_STEP_PERCENT
+                            or now - last_report >= _PROGRESS_MIN_SECONDS
+                            or percent == 100):
+                        print(f'[Uploader] Uploaded {percent}% of the video.')
+                        last_percent, last_report = percent, now
                 retry = 0  # progress made, reset the retry budget
             except HttpError as e:
-                if e.resp.status in retriable_status_codes and retry < max_retries:
+                if e.resp.status in _RETRIABLE_STATUS_CODES and retry < max_retries:
                     retry += 1
-                    sleep_seconds = min(2 ** retry, 64)
+                    sleep_seconds = _backoff_seconds(retry)
                     print(f"[Uploader] Retriable HTTP {e.resp.status} during upload. "
-                          f"Retry {retry}/{max_retries} in {sleep_seconds}s...")
+                          f"Retry {retry}/{max_retries} in {sleep_seconds:.1f}s...")
                     time.sleep(sleep_seconds)
                     continue
                 print(f"[Uploader] Error during video upload: {e}")
@@ -228,9 +320,9 @@ class YouTubeUploader:
             except Exception as e:
                 if retry < max_retries:
                     retry += 1
-                    sleep_seconds = min(2 ** retry, 64)
+                    sleep_seconds = _backoff_seconds(retry)
                     print(f"[Uploader] Transient error during upload: {e}. "
-                          f"Retry {retry}/{max_retries} in {sleep_seconds}s...")
+                          f"Retry {retry}/{max_retries} in {sleep_seconds:.1f}s...")
                     time.sleep(sleep_seconds)
                     continue
                 print(f"[Uploader] Error during video upload: {e}")
@@ -244,20 +336,96 @@ class YouTubeUploader:
             self.set_thumbnail(service, video_id, thumbnail_path)
         return video_id
 
+    def upload_videos(
+        self,
+        service: Any,
+        jobs: Sequence[tuple],
+        max_concurrency: int = 3,
+        creds: Optional[Credentials] = None
+    ) -> List[Optional[str]]:
+        """Upload several videos concurrently.
+
+        Each job is (video_path, metadata) or (video_path, metadata,
+        thumbnail_path), handled by upload_video. Service objects are not
+        thread-safe, so every worker thread builds its own from `creds`
+        (default: the credentials resolved by get_service). Keep
+        max_concurrency small (3-6) to stay clear of YouTube rate limits.
+
+        Returns:
+            Video IDs (None for failed uploads), in the order of `jobs`.
+
+        Raises:
+            ValueError: for a concurrent run when no credentials are known
+                (get_service not called and no `creds` given).
+        """
+        if max_concurrency <= 1 or len(jobs) <= 1:
+            return [self.upload_video(service, *job) for job in jobs]
+
+        creds = creds or self._creds
+        if creds is None:
+            raise ValueError("upload_videos needs credentials for its worker services: "
+                             "call get_service() first or pass creds=")
+        local = threading.local()
+
+        def run(job):
+            if not hasattr(local, 'service'):
+                local.service = self._build_service(creds)
+            return self.upload_video(local.service, *job)
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(jobs))) as pool:
+            return list(pool.map(run, jobs))
+
+    @staticmethod
+    def _pick_chunksize(size: int) -> int:
+        """Chunk size for a video of `size` bytes.
+
+        Small files go in one request. Larger ones use 8 MiB chunks (a
+        multiple of 256 KiB): a dropped connection then costs at most one
+        chunk instead of the whole file, while per-request overhead stays
+        negligible.
+        """
+        if size < 128 * 1024 * 1024:
+            return -1
+        return 8 * 1024 * 1024
+
     def set_thumbnail(self, service: Any, video_id: str, thumbnail_path: str) -> bool:
-        """Set thumbnail for a video."""
+        """Set thumbnail for a video, retrying HTTP 5xx and network errors
+        like upload_video does. An unreadable thumbnail file fails at once."""
         try:
-            print(f"[Uploader] Uploading thumbnail: {thumbnail_path}")
-            service.thumbnails().set(
-                videoId=video_id,
-                media_body=MediaFileUpload(thumbnail_path)
-            ).execute()
-            print(f"[Uploader] Thumbnail uploaded successfully for video ID: {video_id}")
-            return True
-        except Exception as e:
-            print(f"[Uploader] Error during thumbnail upload: {e}")
+            media = MediaFileUpload(thumbnail_path)
+        except OSError as e:
+            print(f"[Uploader] Cannot upload thumbnail {thumbnail_path}: {e}")
             return False
 
+        max_retries = int(os.getenv("UPLOAD_MAX_RETRIES", "5"))
+        print(f"[Uploader] Uploading thumbnail: {thumbnail_path}")
+        for retry in range(max_retries + 1):
+            try:
+                service.thumbnails().set(videoId=video_id, media_body=media).execute()
+                print(f"[Uploader] Thumbnail uploaded successfully for video ID: {video_id}")
+                return True
+            except HttpError as e:
+                if e.resp.status in _RETRIABLE_STATUS_CODES and retry < max_retries:
+                    sleep_seconds = _backoff_seconds(retry + 1)
+                    print(f"[Uploader] Retriable HTTP {e.resp.status} during thumbnail upload. "
+                          f"Retry {retry + 1}/{max_retries} in {sleep_seconds:.1f}s...")
+                    time.sleep(sleep_seconds)
+                    continue
+                print(f"[Uploader] Error during thumbnail upload: {e}")
+                return False
+            except _TRANSIENT_NETWORK_ERRORS as e:
+                if retry < max_retries:
+                    sleep_seconds = _backoff_seconds(retry + 1)
+                    print(f"[Uploader] Transient error during thumbnail upload: {e}. "
+                          f"Retry {retry + 1}/{max_retries} in {sleep_seconds:.1f}s...")
+                    time.sleep(sleep_seconds)
+                    continue
+                print(f"[Uploader] Error during thumbnail upload: {e}")
+                return False
+            except Exception as e:
+                print(f"[Uploader] Error during thumbnail upload: {e}")
+                return False
+
     def add_end_screen_video(self, service: Any, video_id: str, related_video_id: str) -> bool:
         """Link a related video as an end-screen element (video must be >=25s)."""
         try: